@@ -49,7 +49,12 @@ def format_exception(e: Exception) -> str:
 
 
 class TracedException(Exception):
-    """Base traceable exception class."""
+    """Base traceable exception class.
+
+    Nothing is captured or formatted at construction: the traceback is only formatted when
+    traceback_format is called. Raising and swallowing a TracedException is therefore as cheap
+    as for any other exception.
+    """
 
     def traceback_format(self) -> str:
         """Format the exception to a string with its traceback.
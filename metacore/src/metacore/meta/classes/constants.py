@@ -101,10 +101,13 @@ def _verify_annotations_and_coerce(
     Raises:
         ConstantsCompositionError: Raised when an annotated member value is missing.
     """
-    if "__annotations__" in namespace:
-        annotations = resolve_annotation_types(namespace["__annotations__"])
+    raw_annotations = namespace.get("__annotations__")
+    if raw_annotations is not None:
+        annotations = resolve_annotation_types(raw_annotations)
+        constants = namespace["__constants__"]
+        convert_to_annotation = annotation_registry().convert_to_annotation
         for key in annotations:
-            if key not in namespace["__constants__"]:
+            if key not in constants:
                 continue
             # Ensure that any annotated member has a value.
             if key not in namespace:
@@ -114,10 +117,7 @@ def _verify_annotations_and_coerce(
 
             # coerce type
             try:
-                registry = annotation_registry()
-                namespace[key] = registry.convert_to_annotation(
-                    annotations[key], namespace[key]
-                )
+                namespace[key] = convert_to_annotation(annotations[key], namespace[key])
             except Exception as e:
                 raise ConstantsCompositionError(
                     f"Failed to coerce value {namespace[key]!r} to type {annotations[key]} "
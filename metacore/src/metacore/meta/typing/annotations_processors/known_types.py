@@ -32,10 +32,11 @@ Description: Built-in type handlers for the annotation registry. This module reg
 """
 
 from functools import reduce
+from operator import and_
 from types import NotImplementedType, NoneType, EllipsisType
 from typing import Self, Any, ClassVar, Final, Literal, get_args
 
-from .errors import ConvertingToAnnotationTypeError
+from .errors import TypingError, ConvertingToAnnotationTypeError
 from .processors import (
     Annotation,
     AnnotationEntry,
@@ -44,9 +45,8 @@ from .processors import (
     Defaulter,
     ValidationLevel,
     Validator,
-    vl_and,
     annotation_registry,
-    validator_from_annotation,
+    _FULL,
 )
 
 
@@ -125,16 +125,21 @@ class TupleAnnotationEntry(AnnotationEntry):
         /,
     ) -> Validator | NotImplementedType:
         """Create a tuple validator from inner validators."""
-
-        def validator(vs: Any) -> ValidationLevel:
-            if not isinstance(vs, tuple) or len(vs) != len(inner_validators):
+        inner_validators = tuple(inner_validators)
+
+        def validator(
+            vs: Any,
+            _validators: tuple[Validator, ...] = inner_validators,
+            _count: int = len(inner_validators),
+            _full: int = _FULL,
+        ) -> ValidationLevel:
+            if type(vs) is not tuple and not isinstance(vs, tuple) or len(vs) != _count:
                 return ValidationLevel.NONE
-            r = reduce(
-                vl_and,
-                map(lambda f, v: f(v), inner_validators, vs),
-                ValidationLevel.FULL,
-            )
-            return ValidationLevel(r) or ValidationLevel.PARTIAL
+            for f, v in zip(_validators, vs):
+                # Any element that is not a full match makes the tuple a partial match.
+                if f(v) != _full:
+                    return ValidationLevel.PARTIAL
+            return ValidationLevel.FULL
 
         return validator
 
@@ -146,7 +151,19 @@ class TupleAnnotationEntry(AnnotationEntry):
         /,
     ) -> Defaulter | NotImplementedType:
         """Create a tuple defaulter from inner defaulters."""
-        return lambda: tuple(inner_defaulter() for inner_defaulter in inner_defaulters)
+        defaulters = tuple(inner_defaulters)
+        # Small tuples are built directly, about twice as fast as going through a list.
+        match defaulters:
+            case ():
+                return tuple
+            case (d0,):
+                return lambda: (d0(),)
+            case (d0, d1):
+                return lambda: (d0(), d1())
+            case (d0, d1, d2):
+                return lambda: (d0(), d1(), d2())
+        # Comprehensions are inlined since Python 3.12, a generator expression is not.
+        return lambda: tuple([inner_defaulter() for inner_defaulter in defaulters])
 
     def create_converter(
         self,
@@ -155,22 +172,40 @@ class TupleAnnotationEntry(AnnotationEntry):
         _registry: AnnotationsRegistry,
         /,
     ) -> Converter | NotImplementedType:
+        inner_converters = tuple(inner_converters)
         count = len(inner_converters)
-        validator = _registry.validator_from_annotation(annotation)
-
-        def converter(value: Any) -> tuple[Any, ...]:
-            if len(value) != count:
+        # Homogeneous tuples, like tuple[int, int, int], share one converter for all elements.
+        shared = None
+        if count > 1 and inner_converters.count(inner_converters[0]) == count:
+            shared = inner_converters[0]
+
+        def converter(
+            value: Any,
+            _converters: tuple[Converter, ...] = inner_converters,
+            _count: int = count,
+            _shared: Converter | None = shared,
+            _validator: Validator = _registry.validator_from_annotation(annotation),
+            _full: int = _FULL,
+        ) -> tuple[Any, ...]:
+            try:
+                if _validator(value) == _full:
+                    return value
+                # Checked before iterating: iterators are rejected without being consumed, so a
+                # union can still try its other types with them.
+                if len(value) != _count:
+                    raise ConvertingToAnnotationTypeError(
+                        f"Could not convert '{value}' of type '{type(value)}' to '{annotation}'."
+                        " Size mismatch."
+                    )
+                if _shared is not None:
+                    return tuple([_shared(v) for v in value])
+                return tuple([inner_converter(v) for inner_converter, v in zip(_converters, value)])
+            except TypingError:
+                raise
+            except Exception as e:
                 raise ConvertingToAnnotationTypeError(
-                    f"Could not convert '{value}' of type '{type(value)}' to '{annotation}'. Size"
-                    "mismatch."
-                )
-            if validator(value) == ValidationLevel.FULL:
-                return value
-            res = tuple(
-                inner_converter(v)
-                for inner_converter, v in zip(inner_converters, value)
-            )
-            return res
+                    f"Could not convert '{value}' of type '{type(value)}' to '{annotation}'."
+                ) from e
 
         return converter
 
@@ -193,11 +228,23 @@ class DynamicContainerAnnotationEntry[T: type](AnnotationEntry):
         _registry: AnnotationsRegistry,
         /,
     ) -> Validator | NotImplementedType:
-        def validator(vs: Any) -> ValidationLevel:
-            if not isinstance(vs, self._sequence_type):
+        # Bare aliases like typing.List have no inner type, they are validated as the plain type.
+        if not inner_validators:
+            return NotImplemented
+
+        def validator(
+            vs: Any,
+            _sequence_type: T = self._sequence_type,
+            _inner_validator: Validator = inner_validators[0],
+            _full: int = _FULL,
+        ) -> ValidationLevel:
+            # Exact type is the common case, isinstance is only needed for subclasses.
+            if type(vs) is not _sequence_type and not isinstance(vs, _sequence_type):
                 return ValidationLevel.NONE
-            r = reduce(vl_and, map(inner_validators[0], vs), ValidationLevel.FULL)
-            return ValidationLevel(r) or ValidationLevel.PARTIAL
+            for v in vs:
+                if _inner_validator(v) != _full:
+                    return ValidationLevel.PARTIAL
+            return ValidationLevel.FULL
 
         return validator
 
@@ -218,13 +265,25 @@ class DynamicContainerAnnotationEntry[T: type](AnnotationEntry):
         /,
     ) -> Converter | NotImplementedType:
         """Iterable converter creator. Converts all element of the iterable to the correct type."""
-        validator = validator_from_annotation(annotation)
-
-        def converter(value: Any) -> T:
-            if validator(value) == ValidationLevel.FULL:
-                return value
+        if not inner_converters:
+            return NotImplemented
+
+        def converter(
+            value: Any,
+            _sequence_type: T = self._sequence_type,
+            _inner_converter: Converter = inner_converters[0],
+            _validator: Validator = _registry.validator_from_annotation(annotation),
+            _full: int = _FULL,
+        ) -> T:
             try:
-                return self._sequence_type(map(inner_converters[0], value))
+                if _validator(value) == _full:
+                    return value
+                # Comprehensions avoid the map iterator and its per-element dispatch.
+                if _sequence_type is list:
+                    return [_inner_converter(v) for v in value]
+                if _sequence_type is set:
+                    return {_inner_converter(v) for v in value}
+                return _sequence_type(map(_inner_converter, value))
             except Exception as e:
                 raise ConvertingToAnnotationTypeError(
                     f"Could not convert '{value}' of type '{type(value)}' to '{annotation}'."
@@ -295,16 +354,22 @@ class DictAnnotationEntry(AnnotationEntry):
         _registry: AnnotationsRegistry,
         /,
     ) -> Validator | NotImplementedType:
-        def validator(vs: Any) -> ValidationLevel:
+        # Bare typing.Dict has no key and value types, it is validated as the plain type.
+        if len(inner_validators) != 2:
+            return NotImplemented
+
+        def validator(
+            vs: Any,
+            _key_validator: Validator = inner_validators[0],
+            _value_validator: Validator = inner_validators[1],
+            _full: int = _FULL,
+        ) -> ValidationLevel:
             if not isinstance(vs, dict):
                 return ValidationLevel.NONE
-            keys = reduce(
-                vl_and, map(inner_validators[0], vs.keys()), ValidationLevel.FULL
-            )
-            values = reduce(
-                vl_and, map(inner_validators[1], vs.values()), ValidationLevel.FULL
-            )
-            return ValidationLevel(vl_and(keys, values)) or ValidationLevel.PARTIAL
+            # Levels are ints, the C implemented and_ avoids the int casts of vl_and.
+            keys = reduce(and_, map(_key_validator, vs.keys()), _full)
+            values = reduce(and_, map(_value_validator, vs.values()), _full)
+            return ValidationLevel.FULL if keys & values else ValidationLevel.PARTIAL
 
         return validator
 
@@ -324,10 +389,16 @@ class DictAnnotationEntry(AnnotationEntry):
         _registry: AnnotationsRegistry,
         /,
     ) -> Converter | NotImplementedType:
-        def converter(value: Any) -> dict[Any, Any]:
-            return {
-                inner_converters[0](k): inner_converters[1](v) for k, v in value.items()
-            }
+        if len(inner_converters) != 2:
+            return NotImplemented
+
+        # The key and value converters are fetched once instead of indexed for every item.
+        def converter(
+            value: Any,
+            _key_converter: Converter = inner_converters[0],
+            _value_converter: Converter = inner_converters[1],
+        ) -> dict[Any, Any]:
+            return {_key_converter(k): _value_converter(v) for k, v in value.items()}
 
         return converter
 
@@ -348,8 +419,10 @@ class LiteralAnnotationEntry(AnnotationEntry):
         _registry: AnnotationsRegistry,
         /,
     ) -> Validator | NotImplementedType:
-        def validator(v: Any) -> ValidationLevel:
-            if v not in inner_validators:
+        def validator(
+            v: Any, _values: tuple[Any, ...] = tuple(inner_validators)
+        ) -> ValidationLevel:
+            if v not in _values:
                 return ValidationLevel.NONE
             return ValidationLevel.FULL
         return validator
@@ -370,10 +443,10 @@ class LiteralAnnotationEntry(AnnotationEntry):
         _registry: AnnotationsRegistry,
         /,
     ) -> Converter | NotImplementedType:
-        def converter(value: Any) -> Any:
-            if value in inner_converters:
+        def converter(value: Any, _values: tuple[Any, ...] = tuple(inner_converters)) -> Any:
+            if value in _values:
                 return value
-            return inner_converters[0]
+            return _values[0]
         return converter
 
 
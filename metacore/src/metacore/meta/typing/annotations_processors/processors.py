@@ -40,15 +40,15 @@ from __future__ import annotations
 __author__ = "Sébastien Gachoud"
 __license__ = "MIT"
 
+from collections.abc import Hashable
 from enum import IntEnum
-from functools import lru_cache, reduce
-from types import NoneType, NotImplementedType
+from types import NoneType, NotImplementedType, UnionType
 from typing import (
-    DefaultDict,
     Generator,
     Self,
     Any,
     Callable,
+    Union,
     get_args,
     get_origin,
 )
@@ -60,7 +60,7 @@ from .errors import (
     ConvertingToAnnotationTypeError,
     DefaultingAnnotationError,
 )
-from ..utilities import resolve_annotation_types, is_union, is_optional
+from ..utilities import annotation_key, resolve_annotation_type
 
 
 class ValidationLevel(IntEnum):
@@ -78,6 +78,11 @@ class ValidationLevel(IntEnum):
     PARTIAL = 2
 
 
+# Plain int levels for hot path comparisons, cheaper than looking up the enum members.
+_FULL = int(ValidationLevel.FULL)
+_PARTIAL = int(ValidationLevel.PARTIAL)
+
+
 def vl_and(vl1: int, vl2: int) -> int:
     """Logical and between two validation levels with a cast to int."""
     return int(vl1) & int(vl2)
@@ -101,18 +106,69 @@ type ConverterCreator = Callable[..., Converter]
 
 def union_validator(inner_validators: Generator[Validator], _: Any) -> Validator:
     """Create a union validator from inner validators."""
-    inner_validators_list = list(inner_validators)
-    def validator(v: Any) -> ValidationLevel:
-        r = reduce(vl_or, map(lambda f: f(v), inner_validators_list), ValidationLevel.NONE)
-        if r & ValidationLevel.FULL:
+
+    # Constants are bound as defaults so the calls read them as locals.
+    def validator(
+        v: Any,
+        _validators: tuple[Validator, ...] = tuple(inner_validators),
+        _full: int = _FULL,
+        _partial: int = _PARTIAL,
+    ) -> ValidationLevel:
+        r = 0
+        for f in _validators:
+            r |= f(v)
+            # A full match cannot be improved, no need to check the other types.
+            if r & _full:
+                return ValidationLevel.FULL
+        if r & _partial:
+            return ValidationLevel.PARTIAL
+        return ValidationLevel.NONE
+
+    return validator
+
+
+def optional_validator(inner_validator: Validator, _: Any) -> Validator:
+    """Create an optional validator from the validator of the type that is not None."""
+
+    def validator(
+        v: Any,
+        _validator: Validator = inner_validator,
+        _full: int = _FULL,
+        _partial: int = _PARTIAL,
+    ) -> ValidationLevel:
+        if v is None:
+            return ValidationLevel.FULL
+        r = _validator(v)
+        if r & _full:
             return ValidationLevel.FULL
-        if r & ValidationLevel.PARTIAL:
+        if r & _partial:
             return ValidationLevel.PARTIAL
         return ValidationLevel.NONE
 
     return validator
 
 
+def type_validator(v_type: type) -> Validator:
+    """Create a validator checking that values are instances of a specific type.
+
+    Args:
+        v_type (type): the type to check against.
+
+    Returns:
+        Validator: A function that checks if a value is an instance of the specified type.
+    """
+    return lambda v: isinstance(v, v_type)
+
+
+# Shared by every annotation and registry using these types.
+_BUILTIN_VALIDATORS: dict[type, Validator] = {
+    t: type_validator(t) for t in (bool, int, float, complex, str, bytes, NoneType)
+}
+
+# Builtin types known to be valid defaulters when called without arguments.
+_NULLARY_TYPES = frozenset((*_BUILTIN_VALIDATORS, list, tuple, dict, set, frozenset))
+
+
 def none_converter(value: Any) -> None:
     """Convert a value to None. Raises an error if the value is not None.
 
@@ -142,13 +198,19 @@ def type_converter[T](c_type: type[T]) -> Callable[[Any], T]:
         Callable[[Any], T]: A function that converts a value to the specified type.
     """
 
-    def converter(value: Any) -> T:
-        if isinstance(value, c_type):
+    def converter(
+        value: Any,
+        _c_type: type[T] = c_type,
+        _error: type[TypingError] = ConvertingToAnnotationTypeError,
+        _isinstance: Callable[[Any, type], bool] = isinstance,
+    ) -> T:
+        # Exact type match is the common case and a simple pointer comparison.
+        if type(value) is _c_type or _isinstance(value, _c_type):
             return value
         try:
-            return c_type(value)  # type: ignore
+            return _c_type(value)  # type: ignore
         except Exception as e:
-            raise ConvertingToAnnotationTypeError(
+            raise _error(
                 f"Could not convert '{value}' of type '{type(value)}' to '{c_type}'."
             ) from e
 
@@ -172,27 +234,35 @@ def union_converter(
                                 the first matching type of the union.
 
     """
-    validators = list(map(registry.validator_from_annotation, get_args(orig)))
-    # Convert generator to list to avoid exhaustion on multiple calls
-    converters_list = list(inner_converters)
-
-    def converter(value: Any) -> Any:
-        partials: list[Converter] = []
-        others: list[Converter] = []
-        for validator, inner_converter in zip(validators, converters_list):
-            match ValidationLevel(validator(value)):
-                case ValidationLevel.NONE:
-                    others.append(inner_converter)
-                case ValidationLevel.FULL:
-                    return inner_converter(value)
-                case ValidationLevel.PARTIAL:
-                    partials.append(inner_converter)
-
-        for inner_converter in partials + others:
-            try:
-                return inner_converter(value)
-            except Exception:  # pylint: disable=broad-except
-                ...
+    validators = tuple(map(registry.validator_from_annotation, get_args(orig)))
+    # Convert generator to tuple to avoid exhaustion on multiple calls
+    converters = tuple(inner_converters)
+
+    def converter(
+        value: Any,
+        _validators: tuple[Validator, ...] = validators,
+        _converters: tuple[Converter, ...] = converters,
+        _indices: range = range(len(converters)),
+        _full: int = _FULL,
+    ) -> Any:
+        # Bit i is set when the i-th member partially matches, saving list allocations.
+        partials = 0
+        for i, validator in enumerate(_validators):
+            level = validator(value)
+            if level == _full:
+                return _converters[i](value)
+            if level:
+                partials |= 1 << i
+
+        # Partial matches first, then the others, each in declaration order.
+        for is_partial in (1, 0):
+            for i in _indices:
+                if (partials >> i) & 1 != is_partial:
+                    continue
+                try:
+                    return _converters[i](value)
+                except Exception:  # pylint: disable=broad-except
+                    ...
         raise ConvertingToAnnotationTypeError(
             f"Could not convert '{value}' of type '{type(value)}' to '{orig}'."
         )
@@ -200,6 +270,30 @@ def union_converter(
     return converter
 
 
+def optional_converter(inner_converter: Converter, orig: Annotation) -> Converter:
+    """Optional converter. Keeps None and converts anything else with the inner converter.
+
+    Args:
+        inner_converter (Converter): converter of the type that is not None.
+        orig (Any): original annotation for error messages.
+
+    Returns:
+        Converter: A function that converts the provided value to the optional type.
+    """
+
+    def converter(value: Any, _convert: Converter = inner_converter) -> Any:
+        if value is None:
+            return None
+        try:
+            return _convert(value)
+        except Exception as e:
+            raise ConvertingToAnnotationTypeError(
+                f"Could not convert '{value}' of type '{type(value)}' to '{orig}'."
+            ) from e
+
+    return converter
+
+
 class AnnotationEntry:
     """Base class to hold all the processor, and processor creator for an annotation."""
 
@@ -463,33 +557,42 @@ class HousingAnnotationEntry(AnnotationEntry):
         )
 
 
+# Never identical to an annotation, marks that no processor was used since the last clear.
+_NO_LAST_PROCESSOR: tuple[Any, None] = (object(), None)
+
+
 class AnnotationsRegistry:
     """
     A class to hold all the processors, and processors creator for annotations. It allows
     customization.
     """
 
-    class CacheEntry:
-        """
-        A cache entry to store the validator, defaulter and converter of an annotation.
-        """
-
-        def __init__(
-            self,
-            validator: Validator | None = None,
-            defaulter: Defaulter | None = None,
-            converter: Converter | None = None,
-        ) -> NoneType:
-            self.validator = validator
-            self.defaulter = defaulter
-            self.converter = converter
+    __slots__ = (
+        "__processors",
+        "__validators",
+        "__defaulters",
+        "__converters",
+        "__last_defaulter",
+        "__last_converter",
+    )
 
     __processors: dict[Annotation, AnnotationEntry]
-    __cache: DefaultDict[Annotation, CacheEntry]
+    __validators: dict[Hashable, Validator]
+    __defaulters: dict[Hashable, Defaulter]
+    __converters: dict[Hashable, Converter]
+    __last_defaulter: tuple[Annotation, Defaulter | None]
+    __last_converter: tuple[Annotation, Converter | None]
 
     def __init__(self) -> NoneType:
         self.__processors = {}
-        self.__cache = DefaultDict(self.CacheEntry)
+        # Caches of the processors built for resolved annotations. They are keyed with
+        # annotation_key since unions equal up to member order have different processors.
+        self.__validators = {}
+        self.__defaulters = {}
+        self.__converters = {}
+        # Last processor used by the shortcuts, checked by identity before hashing the annotation.
+        self.__last_defaulter = _NO_LAST_PROCESSOR
+        self.__last_converter = _NO_LAST_PROCESSOR
 
     def clear_validator_cache_for_annotation(self, annotation: Annotation) -> None:
         """Clear the validator cache for a specific annotation.
@@ -497,11 +600,8 @@ class AnnotationsRegistry:
         Args:
             annotation (Annotation): The annotation to clear the validator cache for.
         """
-        if annotation in self.__cache:
-            self.__cache[annotation].validator = None
-        annotation = resolve_annotation_types({"_": annotation})["_"]
-        if annotation in self.__cache:
-            self.__cache[annotation].validator = None
+        self.__validators.pop(annotation_key(annotation), None)
+        self.__validators.pop(annotation_key(resolve_annotation_type(annotation)), None)
 
     def clear_defaulter_cache_for_annotation(self, annotation: Annotation) -> None:
         """Clear the defaulter cache for a specific annotation.
@@ -509,11 +609,9 @@ class AnnotationsRegistry:
         Args:
             annotation (Annotation): The annotation to clear the defaulter cache for.
         """
-        if annotation in self.__cache:
-            self.__cache[annotation].defaulter = None
-        annotation = resolve_annotation_types({"_": annotation})["_"]
-        if annotation in self.__cache:
-            self.__cache[annotation].defaulter = None
+        self.__last_defaulter = _NO_LAST_PROCESSOR
+        self.__defaulters.pop(annotation_key(annotation), None)
+        self.__defaulters.pop(annotation_key(resolve_annotation_type(annotation)), None)
 
     def clear_converter_cache_for_annotation(self, annotation: Annotation) -> None:
         """Clear the converter cache for a specific annotation.
@@ -521,11 +619,9 @@ class AnnotationsRegistry:
         Args:
             annotation (Annotation): The annotation to clear the converter cache for.
         """
-        if annotation in self.__cache:
-            self.__cache[annotation].converter = None
-        annotation = resolve_annotation_types({"_": annotation})["_"]
-        if annotation in self.__cache:
-            self.__cache[annotation].converter = None
+        self.__last_converter = _NO_LAST_PROCESSOR
+        self.__converters.pop(annotation_key(annotation), None)
+        self.__converters.pop(annotation_key(resolve_annotation_type(annotation)), None)
 
     def clear_cache_for_annotation(self, annotation: Annotation) -> None:
         """Clear the cache for a specific annotation.
@@ -533,15 +629,17 @@ class AnnotationsRegistry:
         Args:
             annotation (Annotation): The annotation to clear the cache for.
         """
-        if annotation in self.__cache:
-            del self.__cache[annotation]
-        annotation = resolve_annotation_types({"_": annotation})["_"]
-        if annotation in self.__cache:
-            del self.__cache[annotation]
+        self.clear_validator_cache_for_annotation(annotation)
+        self.clear_defaulter_cache_for_annotation(annotation)
+        self.clear_converter_cache_for_annotation(annotation)
 
     def clear_cache(self) -> None:
         """Clear the cache of all annotations. Removes all cached processors."""
-        self.__cache.clear()
+        self.__validators.clear()
+        self.__defaulters.clear()
+        self.__converters.clear()
+        self.__last_defaulter = _NO_LAST_PROCESSOR
+        self.__last_converter = _NO_LAST_PROCESSOR
 
     def register_processor(
         self, annotation: Annotation, processor: AnnotationEntry
@@ -555,7 +653,8 @@ class AnnotationsRegistry:
             processor (AnnotationProcessor): The processor to use for the specified type.
         """
         self.__processors[annotation] = processor
-        self.clear_cache_for_annotation(annotation)
+        # Processors cached for composite annotations may depend on this one.
+        self.clear_cache()
 
     def _register_single_processor(
         self, annotation: Annotation, s_processor: Any, setter: Any
@@ -565,7 +664,7 @@ class AnnotationsRegistry:
             processor = HousingAnnotationEntry.from_processor(processor)
             self.register_processor(annotation, processor)
         else:
-            self.clear_cache_for_annotation(annotation)
+            self.clear_cache()
         setter(processor, s_processor)
 
     def register_validator(self, annotation: Annotation, validator: Validator) -> None:
@@ -716,12 +815,64 @@ class AnnotationsRegistry:
         Returns:
             Validator: The validator, for the specified annotation.
         """
+        key = annotation_key(annotation)
+        # Cache hits dominate, indexing is cheaper than a get call then.
+        try:
+            return self.__validators[key]
+        except KeyError:
+            pass
+        # No lock is taken: concurrent builds may happen but setdefault keeps the first stored
+        # validator so that every caller gets the same one.
+        return self.__validators.setdefault(key, self.__create_validator(annotation))
 
-        cache_entry = self.__cache[annotation]
-        if cache_entry.validator:
-            return cache_entry.validator
+    def __defaulter_from_annotation(self, annotation: Annotation) -> Defaulter:
+        """Get the defaulter for a specific annotation. If a cached value exists, it is returned.
 
-        entry = self.get_processor(annotation)
+        Args:
+            annotation (Annotation): The annotation for which to get the defaulter. This should be
+            a resolved annotation.
+
+        Returns:
+            Defaulter: The defaulter for the specified annotation.
+        """
+        key = annotation_key(annotation)
+        try:
+            return self.__defaulters[key]
+        except KeyError:
+            pass
+        return self.__defaulters.setdefault(key, self.__create_defaulter(annotation))
+
+    def __converter_from_annotation(self, annotation: Annotation) -> Converter:
+        """Get the converter for a specific annotation. If a cached value exists, it is returned.
+
+        Args:
+            annotation (Annotation): The annotation for which to get the converter. This should be
+            a resolved annotation.
+
+        Returns:
+            Converter: The converter for the specified annotation.
+        """
+        key = annotation_key(annotation)
+        try:
+            return self.__converters[key]
+        except KeyError:
+            pass
+        return self.__converters.setdefault(key, self.__create_converter(annotation))
+
+    def __create_validator(self, annotation: Annotation) -> Validator:
+        """Create the validator for a specific annotation.
+
+        Args:
+            annotation (Annotation): The annotation for which to get the validator. This should be
+            a resolved annotation.
+
+        Returns:
+            Validator: The validator, for the specified annotation.
+        """
+
+        # Bound once, the registry is probed for the annotation and possibly its origin.
+        get_processor = self.__processors.get
+        entry = get_processor(annotation)
 
         # Absolute prority to registered validator.
         if entry and entry.validate:
@@ -730,7 +881,7 @@ class AnnotationsRegistry:
         # The annotation might still be a composite type. Composites are not types.
         if isinstance(annotation, type):
             # For the validator just checks if it is an instance of the annotation.
-            return lambda v: isinstance(v, annotation)
+            return _BUILTIN_VALIDATORS.get(annotation) or type_validator(annotation)
 
         # Retrieve the origin of the annotation. Ex.: Union[int, str] -> Union
         origin = get_origin(annotation)
@@ -741,13 +892,9 @@ class AnnotationsRegistry:
                 " origin found."
             )
 
-        origin_entry = self.get_processor(origin)
+        origin_entry = get_processor(origin)
         if origin_entry:
             # Check if there are valid custom creators for the origin.
-            inner_validators = (
-                self.__validator_from_annotation(arg) for arg in get_args(annotation)
-            )
-
             validator = origin_entry.raw_create_validator(annotation, self)
             if validator is not NotImplemented:
                 return validator
@@ -758,17 +905,21 @@ class AnnotationsRegistry:
                 return origin_entry.validate
 
         # Union is a special case.
-        if is_union(origin):
+        if origin is Union or origin is UnionType:
+            args = get_args(annotation)
+            # A processor registered for None must be used, like in any other union.
+            if len(args) == 2 and NoneType in args and get_processor(NoneType) is None:
+                # None is checked by identity, only the other type needs a validator.
+                other = args[1] if args[0] is NoneType else args[0]
+                return optional_validator(self.__validator_from_annotation(other), annotation)
             # Check if there are valid custom creators for the origin.
-            inner_validators = (
-                self.__validator_from_annotation(arg) for arg in get_args(annotation)
-            )
+            inner_validators = (self.__validator_from_annotation(arg) for arg in args)
             return union_validator(inner_validators, annotation)
 
         return self.__validator_from_annotation(origin)
 
-    def __defaulter_from_annotation(self, annotation: Annotation) -> Defaulter:
-        """Get the defaulter for a specific annotation.
+    def __create_defaulter(self, annotation: Annotation) -> Defaulter:
+        """Create the defaulter for a specific annotation.
 
         Args:
             annotation (Annotation): The annotation for which to get the defaulter. This should be
@@ -778,11 +929,8 @@ class AnnotationsRegistry:
             Defaulter: The defaulter for the specified annotation.
         """
 
-        cache_entry = self.__cache[annotation]
-        if cache_entry.defaulter:
-            return cache_entry.defaulter
-
-        entry = self.get_processor(annotation)
+        get_processor = self.__processors.get
+        entry = get_processor(annotation)
 
         # Absolute prority to registered processors.
         if entry and entry.default:
@@ -790,6 +938,9 @@ class AnnotationsRegistry:
 
         # The annotation might still be a composite type. Composites are not types.
         if isinstance(annotation, type):
+            # Builtin types are known to default construct, no need to probe them.
+            if annotation in _NULLARY_TYPES:
+                return annotation
 
             # For the defaulter.
             try:
@@ -800,7 +951,7 @@ class AnnotationsRegistry:
                 # otherwise, raise on request of a defaulter.
                 raise DefaultingAnnotationError(
                     f"Could not deduce defaulter from annotation: {annotation}."
-                    " {annotation}() is not a valid default call."
+                    f" {annotation}() is not a valid default call."
                 ) from e
 
         # Retrieve the origin of the annotation. Ex.: Union[int, str] -> Union
@@ -812,13 +963,9 @@ class AnnotationsRegistry:
                 " origin found."
             )
 
-        origin_entry = self.get_processor(origin)
+        origin_entry = get_processor(origin)
         if origin_entry:
             # Check if there are valid custom creators for the origin.
-            inner_defaulters = (
-                self.__defaulter_from_annotation(arg) for arg in get_args(annotation)
-            )
-
             defaulter = origin_entry.raw_create_defaulter(annotation, self)
             if defaulter is not NotImplemented:
                 return defaulter
@@ -829,22 +976,20 @@ class AnnotationsRegistry:
                 return origin_entry.default
 
         # Union is a special case.
-        if is_union(origin):
-            # Check if there are valid custom creators for the origin.
-            inner_defaulters = (
-                self.__defaulter_from_annotation(arg) for arg in get_args(annotation)
-            )
+        if origin is Union or origin is UnionType:
+            # The origin is known to be a union, no need for is_optional.
+            args = get_args(annotation)
             # For an optional, always give None as defaulter.
-            if is_optional(annotation):
+            if NoneType in args:
                 return NoneType
             # Otherwise, give the default from the first type.
             # The user should always put the type that should be the default first.
-            return next(inner_defaulters)
+            return self.__defaulter_from_annotation(args[0])
 
         return self.__defaulter_from_annotation(origin)
 
-    def __converter_from_annotation(self, annotation: Annotation) -> Converter:
-        """Get the converter for a specific annotation.
+    def __create_converter(self, annotation: Annotation) -> Converter:
+        """Create the converter for a specific annotation.
 
         Args:
             annotation (Annotation): The annotation for which to get the converter.
@@ -853,11 +998,8 @@ class AnnotationsRegistry:
             Converter: The converter for the specified annotation.
         """
 
-        cache_entry = self.__cache[annotation]
-        if cache_entry.converter:
-            return cache_entry.converter
-
-        entry = self.get_processor(annotation)
+        get_processor = self.__processors.get
+        entry = get_processor(annotation)
 
         # Absolute prority to registered processors.
         if entry and entry.convert:
@@ -877,13 +1019,9 @@ class AnnotationsRegistry:
                 " origin found."
             )
 
-        origin_entry = self.get_processor(origin)
+        origin_entry = get_processor(origin)
         if origin_entry:
             # Check if there are valid custom creators for the origin.
-            inner_converters = (
-                self.__converter_from_annotation(arg) for arg in get_args(annotation)
-            )
-
             converter = origin_entry.raw_create_converter(annotation, self)
             if converter is not NotImplemented:
                 return converter
@@ -894,11 +1032,15 @@ class AnnotationsRegistry:
                 return origin_entry.convert
 
         # Union is a special case.
-        if is_union(origin):
+        if origin is Union or origin is UnionType:
+            args = get_args(annotation)
+            # A processor registered for None must be used, like in any other union.
+            if len(args) == 2 and NoneType in args and get_processor(NoneType) is None:
+                # Only the other type needs a converter, None is kept as is.
+                other = args[1] if args[0] is NoneType else args[0]
+                return optional_converter(self.__converter_from_annotation(other), annotation)
             # Check if there are valid custom creators for the origin.
-            inner_converters = (
-                self.__converter_from_annotation(arg) for arg in get_args(annotation)
-            )
+            inner_converters = (self.__converter_from_annotation(arg) for arg in args)
             return union_converter(inner_converters, annotation, self)
 
         return self.__converter_from_annotation(origin)
@@ -916,7 +1058,7 @@ class AnnotationsRegistry:
             tuple[Validator | Exception, Defaulter | Exception, Converter | Exception]: The
                 validator, defaulter and converter for the specified annotation.
         """
-        annotation = resolve_annotation_types({"_": annotation})["_"]
+        annotation = resolve_annotation_type(annotation)
         try:
             v = self.__validator_from_annotation(annotation)
         except TypingError as e:
@@ -951,8 +1093,13 @@ class AnnotationsRegistry:
         Returns:
             Validator: The validator function for the provided annotation.
         """
-        annotation = resolve_annotation_types({"_": annotation})["_"]
-        return self.__validator_from_annotation(annotation)
+        # Most annotations resolve to themselves and are found without being resolved again.
+        # Unhashable ones, like Annotated with dict metadata, are hashable once resolved.
+        try:
+            return self.__validators[annotation_key(annotation)]
+        except (KeyError, TypeError):
+            pass
+        return self.__validator_from_annotation(resolve_annotation_type(annotation))
 
     def defaulter_from_annotation(self, annotation: Annotation) -> Defaulter:
         """Provides a callable that defaults an annotation. If one of the type in the annotation
@@ -972,8 +1119,11 @@ class AnnotationsRegistry:
         Returns:
             Defaulter: The defaulter function for the provided annotation.
         """
-        annotation = resolve_annotation_types({"_": annotation})["_"]
-        return self.__defaulter_from_annotation(annotation)
+        try:
+            return self.__defaulters[annotation_key(annotation)]
+        except (KeyError, TypeError):
+            pass
+        return self.__defaulter_from_annotation(resolve_annotation_type(annotation))
 
     def converter_from_annotation(self, annotation: Annotation) -> Converter:
         """Provides a callable that converts a value to an annotation. If one of the type in the
@@ -990,24 +1140,22 @@ class AnnotationsRegistry:
             >>> print(converter((1.0, 2, "3.0"))) # (1, "2", 3.0)
             >>> print(converter((1, 2))) # ConvertingToAnnotationTypeError
 
-        If first_in_union is True, the converter will always convert to the first type in the union.
-            >>> converter = converter(str | int, first_in_union=True)
-            >>> print(converter("42")) # '42'
-            >>> print(converter(42)) # '42'
-        Otherwise, if the type is in the union, the value will be kept as is.
-            >>> converter = converter(str | int)
+        If the type of the value is in a union, the value will be kept as is.
+            >>> converter = converter_from_annotation(str | int)
             >>> print(converter("42")) # '42'
             >>> print(converter(42)) # 42
 
         Args:
             annotation (Any): The annotation to convert.
-            first_in_union (bool): If true, force conversion to the first type in the union.
 
         Returns:
             Converter: The converter function for the provided annotation.
         """
-        annotation = resolve_annotation_types({"_": annotation})["_"]
-        return self.__converter_from_annotation(annotation)
+        try:
+            return self.__converters[annotation_key(annotation)]
+        except (KeyError, TypeError):
+            pass
+        return self.__converter_from_annotation(resolve_annotation_type(annotation))
 
     def validate_with_annotation(
         self, annotation: Annotation, value: Any
@@ -1017,14 +1165,26 @@ class AnnotationsRegistry:
 
     def default_annotation(self, annotation: Annotation) -> Any:
         """This function is a shortcut to self.defaulter_from_annotation(annotation)()."""
-        return self.defaulter_from_annotation(annotation)()
+        last_annotation, defaulter = self.__last_defaulter
+        if last_annotation is not annotation:
+            defaulter = self.defaulter_from_annotation(annotation)
+            # Stored as a single tuple so that concurrent calls never see a mismatched pair.
+            self.__last_defaulter = (annotation, defaulter)
+        return defaulter()
 
     def convert_to_annotation(self, annotation: Annotation, value: Any) -> Any:
         """This function is a shortcut to self.converter_from_annotation(annotation)(value)."""
-        return self.converter_from_annotation(annotation)(value)
+        last_annotation, converter = self.__last_converter
+        if last_annotation is not annotation:
+            converter = self.converter_from_annotation(annotation)
+            self.__last_converter = (annotation, converter)
+        return converter(value)
+
+
+# Built eagerly so that the shortcuts below read a global instead of going through a cache.
+_annotation_registry = AnnotationsRegistry()
 
 
-@lru_cache(1)
 def annotation_registry() -> AnnotationsRegistry:
     """Default annotation registry. Allows to register custom type defaulters and converters.
     See AnnotationRegistery for more information.
@@ -1032,31 +1192,31 @@ def annotation_registry() -> AnnotationsRegistry:
     Returns:
         TypeRegistry: the type registry instance.
     """
-    return AnnotationsRegistry()
+    return _annotation_registry
 
 
 def validator_from_annotation(annotation: Annotation) -> Validator:
     """This function is a shortcut to `annotation_registry().validator_from_annotation()`."""
-    return annotation_registry().validator_from_annotation(annotation)
+    return _annotation_registry.validator_from_annotation(annotation)
 
 
 def defaulter_from_annotation(annotation: Annotation) -> Defaulter:
     """This function is a shortcut to `annotation_registry().defaulter_from_annotation()`."""
-    return annotation_registry().defaulter_from_annotation(annotation)
+    return _annotation_registry.defaulter_from_annotation(annotation)
 
 
 def validate_from_annotation(
     annotation: Annotation, value: Any
 ) -> bool | ValidationLevel:
     """This function is a shortcut to `annotation_registry().validate()`."""
-    return annotation_registry().validate_with_annotation(annotation, value)
+    return _annotation_registry.validate_with_annotation(annotation, value)
 
 
 def default_from_annotation(annotation: Annotation) -> Any:
     """This function is a shortcut to `annotation_registry().default()`."""
-    return annotation_registry().default_annotation(annotation)
+    return _annotation_registry.default_annotation(annotation)
 
 
 def convert_to_annotation(annotation: Annotation, value: Any) -> Any:
     """This function is a shortcut to `annotation_registry().convert_to_annotation()`."""
-    return annotation_registry().convert_to_annotation(annotation, value)
+    return _annotation_registry.convert_to_annotation(annotation, value)
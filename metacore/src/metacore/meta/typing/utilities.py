@@ -4,11 +4,25 @@ This module provides helper functions for working with Python type annotations,
 including utilities for checking union types, optional types, and resolving
 forward references in annotations.
 """
+from collections.abc import Hashable
+from threading import RLock
 from typing import Any, Union, get_origin, get_args, get_type_hints
 from types import UnionType, NoneType
 
 type Annotation = Any
 
+
+class _AnnotationsHolder:
+    """Class whose annotations are swapped to resolve annotations with get_type_hints. Reusing it
+    avoids creating a new class on every resolution."""
+
+
+_annotations_holder_lock = RLock()
+
+# Hash based membership avoids falling back to the slow typing equality checks.
+_UNION_ORIGINS = frozenset((Union, UnionType))
+
+
 def is_union(annotation: Annotation) -> bool:
     """Check if an annotation is a union. A union is a Union or UnionType type.
 
@@ -18,8 +32,14 @@ def is_union(annotation: Annotation) -> bool:
     Returns:
         bool: Whether the annotation is a union.
     """
-    o = get_origin(annotation) or annotation
-    return o in (Union, UnionType)
+    o = get_origin(annotation)
+    if o is None:
+        o = annotation
+    try:
+        return o in _UNION_ORIGINS
+    except TypeError:
+        # Unhashable annotations, like a list of Callable arguments, are never unions.
+        return False
 
 
 def is_optional(annotation: Annotation) -> bool:
@@ -50,6 +70,34 @@ def is_binary_optional(annotation: Annotation) -> bool:
     return len(args) == 2 and NoneType in args
 
 
+def annotation_key(annotation: Annotation) -> Hashable:
+    """Get an order preserving key of an annotation, to use in caches.
+
+    Unions and Literals compare equal whatever the order of their members, while the first member
+    wins when defaulting or converting. The key keeps the order of the arguments at every level.
+    Union[int, str] and int | str are processed the same way and share their key.
+
+    Args:
+        annotation (Any): The annotation to get the key of.
+
+    Returns:
+        Hashable: The key of the annotation.
+    """
+    if isinstance(annotation, type):
+        return annotation
+    if isinstance(annotation, list):
+        # Callable parameters are given as a list.
+        return (list, tuple(map(annotation_key, annotation)))
+    args = get_args(annotation)
+    if not args:
+        # Literal values are keyed with their type, Literal[1] and Literal[True] differ.
+        return (type(annotation), annotation)
+    origin = get_origin(annotation)
+    if origin is UnionType:
+        origin = Union
+    return (origin, tuple(map(annotation_key, args)))
+
+
 def resolve_annotation_types(annotations: dict[str, Any]) -> dict[str, Annotation]:
     """
     Get type hints from a dictionary of annotations. See typing.get_type_hints.
@@ -63,5 +111,42 @@ def resolve_annotation_types(annotations: dict[str, Any]) -> dict[str, Annotatio
     Returns:
         dict[str, Any]: A dictionary of type hints.
     """
-    X = type("X", (), {"__annotations__": annotations})
-    return get_type_hints(X)
+    # get_type_hints reads the annotations once, a re-entrant resolution cannot disturb it.
+    with _annotations_holder_lock:
+        _AnnotationsHolder.__annotations__ = annotations
+        try:
+            return get_type_hints(_AnnotationsHolder)
+        finally:
+            _AnnotationsHolder.__annotations__ = {}
+
+
+# Keyed with annotation_key, annotations differing by the order of their members are distinct.
+_resolved_annotations: dict[Hashable, Annotation] = {}
+
+
+def resolve_annotation_type(annotation: Annotation) -> Annotation:
+    """
+    Resolve a single annotation. See resolve_annotation_types.
+
+    Resolutions of hashable annotations are cached.
+
+    Args:
+        annotation (Any): The annotation to resolve.
+
+    Returns:
+        Any: The resolved annotation.
+    """
+    # Plain classes resolve to themselves, generic aliases are not classes.
+    if isinstance(annotation, type):
+        return annotation
+    if annotation is None:
+        return NoneType
+    try:
+        key = annotation_key(annotation)
+        return _resolved_annotations[key]
+    except KeyError:
+        resolved = resolve_annotation_types({"_": annotation})["_"]
+        return _resolved_annotations.setdefault(key, resolved)
+    except TypeError:
+        # Unhashable annotations cannot be cached. Resolution errors are raised again here.
+        return resolve_annotation_types({"_": annotation})["_"]
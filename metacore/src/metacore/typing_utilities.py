@@ -10,6 +10,8 @@ from .meta.typing.utilities import (
     is_optional,
     is_binary_optional,
     resolve_annotation_types,
+    resolve_annotation_type,
+    annotation_key,
 )
 
 __all__ = [
@@ -17,4 +19,6 @@ __all__ = [
     "is_optional",
     "is_binary_optional",
     "resolve_annotation_types",
+    "resolve_annotation_type",
+    "annotation_key",
 ]
@@ -34,7 +34,7 @@ Note: Updated to test the new annotation registry architecture.
 __author__ = "Sébastien Gachoud"
 __license__ = "MIT"
 
-from typing import Union, Optional, Any, Literal, Final, ClassVar
+from typing import Union, Optional, Any, Literal, Final, ClassVar, Callable, Dict, List, Annotated
 from types import NoneType
 
 import pytest
@@ -45,6 +45,7 @@ from metacore.src.metacore.annotations_processors import (
     ConvertingToAnnotationTypeError,
     AnnotationsRegistry,
     AnnotationEntry,
+    HousingAnnotationEntry,
     ValidationLevel,
     annotation_registry,
     validator_from_annotation,
@@ -55,11 +56,13 @@ from metacore.src.metacore.meta.typing.annotations_processors.processors import
     vl_and,
     vl_or,
 )
-from metacore.src.metacore.utilities import (
+from metacore.src.metacore.typing_utilities import (
     is_union,
     is_optional,
     is_binary_optional,
     resolve_annotation_types,
+    resolve_annotation_type,
+    annotation_key,
 )
 
 
@@ -169,6 +172,29 @@ class TestTypeUtilities:
         assert resolved["x"] is int
         assert resolved["y"] is str
 
+    def test_resolve_annotation_type(self):
+        """Test single annotation resolution."""
+        assert resolve_annotation_type("int") is int
+        assert resolve_annotation_type(int) is int
+        assert resolve_annotation_type(None) is NoneType
+        assert resolve_annotation_type(list["int"]) == list[int]
+
+    def test_annotation_key(self):
+        """Test that equal spellings share a key while reordered members do not."""
+        assert annotation_key(int) is int
+        assert annotation_key(list[int]) == annotation_key(List[int])
+        assert annotation_key(list[int | str]) != annotation_key(list[str | int])
+        assert annotation_key(Literal[1]) != annotation_key(Literal[True])
+        callable_key = annotation_key(Callable[[int], str])
+        assert hash(callable_key) == hash(annotation_key(Callable[[int], str]))
+
+    def test_resolve_annotation_type_keeps_order(self):
+        """Test that resolving a union does not reuse an equal union with another member order."""
+        assert resolve_annotation_type(int | str).__args__ == (int, str)
+        assert resolve_annotation_type(str | int).__args__ == (str, int)
+        assert resolve_annotation_type(Literal[1, 2]).__args__ == (1, 2)
+        assert resolve_annotation_type(Literal[2, 1]).__args__ == (2, 1)
+
 
 class TestBasicConversion:
     """Test basic type conversion functionality."""
@@ -186,11 +212,19 @@ class TestBasicConversion:
         with pytest.raises(ConvertingToAnnotationTypeError):
             convert_to_annotation(NoneType, 42)
 
+    def test_convert_unhashable_metadata(self):
+        """Test conversion to annotations carrying unhashable Annotated metadata."""
+        assert convert_to_annotation(Annotated[int, {"unit": "m"}], "3") == 3
+        assert convert_to_annotation(list[Annotated[int, {"unit": "m"}]], ["3"]) == [3]
+
     def test_convert_optional_types(self):
         """Test conversion with Optional types."""
         assert convert_to_annotation(Optional[int], None) is None
         assert convert_to_annotation(Optional[int], "42") == 42
         assert convert_to_annotation(Optional[str], None) is None
+        assert convert_to_annotation(None | int, "42") == 42
+        with pytest.raises(ConvertingToAnnotationTypeError):
+            convert_to_annotation(Optional[int], "not a number")
 
 
 class TestListConversion:
@@ -201,6 +235,12 @@ class TestListConversion:
         result = convert_to_annotation(list[int], ["1", "2", "3"])
         assert result == [1, 2, 3]
 
+    def test_convert_list_already_matching(self):
+        """Test converting a list that already matches returns the same list."""
+        value = [[1], [2, 3]]
+        assert convert_to_annotation(list[list[int]], value) is value
+        assert convert_to_annotation(list[list[int]], [[1], ["2"]]) == [[1], [2]]
+
     def test_convert_list_of_strings(self):
         """Test converting list with string elements."""
         result = convert_to_annotation(list[str], [1, 2, 3])
@@ -216,6 +256,11 @@ class TestListConversion:
         result = convert_to_annotation(list[list[int]], [["1", "2"], ["3", "4"]])
         assert result == [[1, 2], [3, 4]]
 
+    def test_convert_bare_list_alias(self):
+        """Test conversion to bare typing.List, alone or in an optional."""
+        assert convert_to_annotation(Optional[List], None) is None
+        assert convert_to_annotation(List, ("1", 2)) == ["1", 2]
+
 
 class TestTupleConversion:
     """Test tuple type conversion."""
@@ -230,11 +275,29 @@ class TestTupleConversion:
         result = convert_to_annotation(tuple[int, str, float], ("1", 2, "3.14"))
         assert result == (1, "2", 3.14)
 
+    def test_convert_tuple_homogeneous(self):
+        """Test tuple with a single element type."""
+        assert convert_to_annotation(tuple[int, int, int], ("1", 2, 3.0)) == (1, 2, 3)
+        with pytest.raises(ConvertingToAnnotationTypeError):
+            convert_to_annotation(tuple[int, int, int], (1, 2))
+
     def test_convert_tuple_size_mismatch(self):
         """Test that tuple size mismatch raises error."""
         with pytest.raises(ConvertingToAnnotationTypeError):
             convert_to_annotation(tuple[int, str], (1,))
 
+    def test_convert_tuple_rejects_iterator(self):
+        """Test tuple conversion rejects iterables without a length instead of consuming them."""
+        values = iter(["1", 2])
+        with pytest.raises(ConvertingToAnnotationTypeError):
+            convert_to_annotation(tuple[int, str], values)
+        assert list(values) == ["1", 2]
+
+    def test_convert_tuple_already_matching(self):
+        """Test converting a tuple that already matches returns the same tuple."""
+        value = (1, "2", [3])
+        assert convert_to_annotation(tuple[int, str, list[int]], value) is value
+
 
 class TestDictConversion:
     """Test dict type conversion."""
@@ -256,6 +319,11 @@ class TestDictConversion:
         result = convert_to_annotation(dict[str, int], {})
         assert result == {}
 
+    def test_convert_bare_dict_alias(self):
+        """Test conversion to bare typing.Dict, alone or in a union."""
+        assert convert_to_annotation(Union[int, Dict], 3) == 3
+        assert convert_to_annotation(Dict, [(1, "a")]) == {1: "a"}
+
 
 class TestSetConversion:
     """Test set type conversion."""
@@ -294,6 +362,13 @@ class TestLiteralConversion:
         result = convert_to_annotation(Literal[1, 2, 3], 2)
         assert result == 2
 
+    def test_literal_member_order(self):
+        """Test that a Literal does not reuse the processors of its reordered equivalent."""
+        assert convert_to_annotation(Literal[1, 2], 3) == 1
+        assert default_from_annotation(Literal[1, 2]) == 1
+        assert convert_to_annotation(Literal[2, 1], 3) == 2
+        assert default_from_annotation(Literal[2, 1]) == 2
+
 
 class TestFinalAndClassVarConversion:
     """Test Final and ClassVar type conversion."""
@@ -332,6 +407,33 @@ class TestUnionConversion:
         result = convert_to_annotation(Union[int, str], 42.8)
         assert result == 42  # Should convert to int (first type)
 
+    def test_convert_union_partial_match_first(self):
+        """Test union conversion tries partially matching types before the others."""
+        result = convert_to_annotation(Union[tuple[str], list[int]], ["1"])
+        assert result == [1]
+
+    def test_convert_union_iterator_not_consumed(self):
+        """Test that a failed tuple conversion leaves an iterator to the other union types."""
+        result = convert_to_annotation(Union[tuple[str], list[int]], iter([1, 2]))
+        assert result == [1, 2]
+
+    def test_union_member_order(self):
+        """Test that a union does not reuse the processors of its reordered equivalent."""
+        assert default_from_annotation(int | str) == 0
+        assert convert_to_annotation(int | str, 4.5) == 4
+        assert default_from_annotation(str | int) == ""
+        assert convert_to_annotation(str | int, 4.5) == "4.5"
+        assert convert_to_annotation(list[str | int], [4.5]) == ["4.5"]
+        registry = AnnotationsRegistry()
+        assert registry.convert_to_annotation(str | int, 4.5) == "4.5"
+
+    def test_union_spellings_share_converter(self):
+        """Test that Union and | spellings of the same union share their converter."""
+        registry = annotation_registry()
+        converter = registry.converter_from_annotation(Union[int, str])
+        assert registry.converter_from_annotation(int | str) is converter
+        assert registry.converter_from_annotation(str | int) is not converter
+
 
 class TestComplexNestedTypes:
     """Test complex nested type conversions."""
@@ -373,6 +475,13 @@ class TestDefaultValues:
         result = default_from_annotation(tuple[int, str])
         assert result == (0, "")
 
+    def test_default_tuple_sizes(self):
+        """Test default for tuples of various sizes."""
+        assert default_from_annotation(tuple[()]) == ()
+        assert default_from_annotation(tuple[int]) == (0,)
+        assert default_from_annotation(tuple[int, str, float]) == (0, "", 0.0)
+        assert default_from_annotation(tuple[int, str, float, bool]) == (0, "", 0.0, False)
+
     def test_default_optional(self):
         """Test default for Optional type."""
         assert default_from_annotation(Optional[int]) is None
@@ -406,6 +515,14 @@ class TestValidation:
         assert tuple_validator((42, 123)) == ValidationLevel.PARTIAL
         assert tuple_validator([42, "hello"]) == ValidationLevel.NONE
 
+    def test_validate_tuple_sizes(self):
+        """Test validation of tuples of various sizes."""
+        for size in range(1, 5):
+            tuple_validator = validator_from_annotation(tuple[(int,) * size])
+            assert tuple_validator((1,) * size) == ValidationLevel.FULL
+            assert tuple_validator((1,) * (size - 1) + ("1",)) == ValidationLevel.PARTIAL
+            assert tuple_validator((1,) * (size + 1)) == ValidationLevel.NONE
+
     def test_validate_optional(self):
         """Test Optional validation."""
         optional_validator = validator_from_annotation(Optional[int])
@@ -413,6 +530,8 @@ class TestValidation:
         x = optional_validator(None)
         assert x == ValidationLevel.FULL
         assert optional_validator("42") == ValidationLevel.NONE
+        optional_list_validator = validator_from_annotation(None | list[int])
+        assert optional_list_validator([1, "2"]) == ValidationLevel.PARTIAL
 
     def test_validate_union(self):
         """Test Union validation."""
@@ -421,6 +540,17 @@ class TestValidation:
         assert union_validator("hello") == ValidationLevel.FULL
         assert union_validator(42.0) == ValidationLevel.NONE
 
+    def test_validate_bare_list_alias(self):
+        """Test that bare typing.List validates like list, including inside other annotations."""
+        assert validator_from_annotation(Optional[List])(None) == ValidationLevel.FULL
+        assert validator_from_annotation(List)([1, "a"]) == ValidationLevel.FULL
+        assert validator_from_annotation(list[List])([]) == ValidationLevel.FULL
+
+    def test_validate_bare_dict_alias(self):
+        """Test that bare typing.Dict validates like dict."""
+        assert validator_from_annotation(Dict)({1: "a"}) == ValidationLevel.FULL
+        assert validator_from_annotation(Optional[Dict])(None) == ValidationLevel.FULL
+
 
 class TestErrorHandling:
     """Test error handling and edge cases."""
@@ -514,6 +644,102 @@ class TestCustomTypeRegistration:
         assert isinstance(result, CustomType)
         assert result.value == 42
 
+    def test_processors_are_cached(self):
+        """Test that processors built for an annotation are reused."""
+        registry = AnnotationsRegistry()
+        assert registry.validator_from_annotation(
+            list[int]
+        ) is registry.validator_from_annotation(list[int])
+        assert registry.converter_from_annotation(
+            list[int]
+        ) is registry.converter_from_annotation(list[int])
+
+    def test_register_invalidates_composite_cache(self):
+        """Test that registering a processor updates cached composite processors."""
+        registry = annotation_registry()
+
+        class CustomType:
+            pass
+
+        assert validator_from_annotation(list[CustomType])(["x"]) == ValidationLevel.PARTIAL
+        registry.register_validator(CustomType, lambda v: isinstance(v, str))
+        assert validator_from_annotation(list[CustomType])(["x"]) == ValidationLevel.FULL
+
+    def test_register_invalidates_last_converter(self):
+        """Test that registering a converter replaces the last converter used."""
+        registry = AnnotationsRegistry()
+
+        class Meters(float):
+            pass
+
+        assert registry.convert_to_annotation(Meters, "1") == 1.0
+        registry.register_converter(Meters, lambda v: Meters(float(v) * 2))
+        assert registry.convert_to_annotation(Meters, "1") == 2.0
+
+    def test_optional_uses_registered_none_converter(self):
+        """Test that optionals use a converter registered for NoneType, like other unions."""
+        registry = AnnotationsRegistry()
+
+        def none_from_empty(value: Any) -> None:
+            if value is None or value == "":
+                return None
+            raise ConvertingToAnnotationTypeError(f"{value} is not empty.")
+
+        registry.register_converter(NoneType, none_from_empty)
+        assert registry.convert_to_annotation(Optional[int], "") is None
+        assert registry.convert_to_annotation(Union[int, None, float], "") is None
+        assert registry.convert_to_annotation(Optional[int], "3") == 3
+
+    def test_optional_uses_registered_none_validator(self):
+        """Test that optionals use a validator registered for NoneType, like other unions."""
+        registry = AnnotationsRegistry()
+        registry.register_validator(NoneType, lambda v: v is None or v == "null")
+        assert registry.validator_from_annotation(Optional[int])("null") == ValidationLevel.FULL
+        assert registry.validator_from_annotation(Optional[int])("3") == ValidationLevel.NONE
+
+    def test_list_keeps_elements_valid_for_custom_validator(self):
+        """Test that list elements accepted by a registered validator are not converted."""
+        registry = annotation_registry()
+
+        class CustomType:
+            pass
+
+        registry.register_validator(CustomType, lambda v: isinstance(v, str))
+        assert convert_to_annotation(list[CustomType], ["x"]) == ["x"]
+
+    def test_list_does_not_reconvert_valid_custom_elements(self):
+        """Test that a registered converter is not applied to an already valid list."""
+        registry = annotation_registry()
+
+        class Meters(float):
+            pass
+
+        registry.register_converter(Meters, lambda v: Meters(float(v) * 2))
+        value = [Meters(1.0)]
+        assert convert_to_annotation(list[Meters], value) is value
+
+    def test_tuple_keeps_elements_valid_for_custom_validator(self):
+        """Test that tuple elements accepted by a registered validator are not converted."""
+        registry = annotation_registry()
+
+        class CustomType:
+            pass
+
+        registry.register_validator(CustomType, lambda v: isinstance(v, str))
+        assert convert_to_annotation(tuple[CustomType], ("x",)) == ("x",)
+        assert convert_to_annotation(tuple[CustomType, CustomType], ("x", "y")) == ("x", "y")
+
+    def test_tuple_does_not_reconvert_valid_custom_elements(self):
+        """Test that a registered converter is not applied to an already valid tuple."""
+        registry = annotation_registry()
+
+        class Meters(float):
+            pass
+
+        registry.register_converter(Meters, lambda v: Meters(float(v) * 2))
+        value = (Meters(1.0), Meters(2.0))
+        assert convert_to_annotation(tuple[Meters, Meters], value) is value
+
 
 class TestAnnotationEntry:
     """Test AnnotationEntry base class behavior."""
@@ -526,6 +752,27 @@ class TestAnnotationEntry:
         assert hasattr(AnnotationEntry, "create_defaulter")
         assert hasattr(AnnotationEntry, "create_converter")
 
+    def test_annotation_entry_processors_can_be_set(self):
+        """Test that processors can be assigned on an AnnotationEntry instance."""
+        entry = AnnotationEntry()
+        entry.convert = str
+        assert entry.convert(1) == "1"
+
+    def test_housing_entry_keeps_subclass_processors(self):
+        """Test that a HousingAnnotationEntry subclass keeps the processors it defines."""
+
+        class CustomEntry(HousingAnnotationEntry):
+            @staticmethod
+            def convert(value: Any, /) -> Any:
+                return str(value)
+
+            def create_validator(self, inner_validators, annotation, registry, /):
+                return inner_validators[0]
+
+        entry = CustomEntry()
+        assert entry.convert(1) == "1"
+        assert entry.create_validator([bool], None, None) is bool
+
 
 class TestIntegration:
     """Integration tests combining multiple components."""